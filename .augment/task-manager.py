@@ -5,25 +5,46 @@ Simple utility to manage development tasks for the SpecKit project
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+TASKS_FILE = Path(__file__).parent / "tasks.json"
+
+def _loads(raw):
+    """Decode tasks.json bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _dumps(data):
+    """Encode tasks as indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 def load_tasks():
     """Load tasks from tasks.json"""
-    tasks_file = Path(__file__).parent / "tasks.json"
-    if not tasks_file.exists():
+    try:
+        raw = TASKS_FILE.read_bytes()
+    except FileNotFoundError:
         print("❌ tasks.json not found!")
         return None
-    
-    with open(tasks_file, 'r') as f:
-        return json.load(f)
+    return _loads(raw)
 
 def save_tasks(data):
     """Save tasks to tasks.json"""
-    tasks_file = Path(__file__).parent / "tasks.json"
-    with open(tasks_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Write the whole payload in one call, then swap it in atomically
+    tmp_file = TASKS_FILE.with_suffix('.json.tmp')
+    with open(tmp_file, 'wb', buffering=0) as f:
+        f.write(_dumps(data))
+    os.replace(tmp_file, TASKS_FILE)
 
 def list_tasks():
     """List all tasks with their status"""
@@ -31,22 +52,23 @@ def list_tasks():
     if not data:
         return
     
-    print(f"\n🚀 {data['project']} Development Tasks")
-    print(f"📅 Created: {data['created']}")
-    print(f"📊 Total: {data['summary']['total_tasks']} main tasks, {data['summary']['total_subtasks']} subtasks")
-    print(f"⏱️  Estimated: {data['summary']['estimated_total_hours']} hours\n")
+    out = []
+    out.append(f"\n🚀 {data['project']} Development Tasks")
+    out.append(f"📅 Created: {data['created']}")
+    out.append(f"📊 Total: {data['summary']['total_tasks']} main tasks, {data['summary']['total_subtasks']} subtasks")
+    out.append(f"⏱️  Estimated: {data['summary']['estimated_total_hours']} hours\n")
     
     for task in data['tasks']:
         status_icon = "✅" if task['status'] == 'completed' else "🔄" if task['status'] == 'in_progress' else "⭕"
         priority_icon = "🔥" if task['priority'] == 'high' else "📋"
         
-        print(f"{status_icon} {priority_icon} {task['id']}: {task['name']}")
-        print(f"   📝 {task['description'][:80]}...")
+        out.append(f"{status_icon} {priority_icon} {task['id']}: {task['name']}")
+        out.append(f"   📝 {task['description'][:80]}...")
         
         # Show subtasks
         completed_subtasks = sum(1 for st in task['subtasks'] if st['status'] == 'completed')
         total_subtasks = len(task['subtasks'])
-        print(f"   📊 Subtasks: {completed_subtasks}/{total_subtasks} completed")
+        out.append(f"   📊 Subtasks: {completed_subtasks}/{total_subtasks} completed")
         
         # Sort subtasks by execution order
         sorted_subtasks = sorted(task['subtasks'], key=lambda x: x.get('execution_order', 1))
@@ -56,8 +78,19 @@ def list_tasks():
             parallel_marker = "🔀" if subtask.get('parallel', False) else "➡️"
             deps = subtask.get('dependencies', [])
             dep_info = f" (deps: {', '.join(deps)})" if deps else ""
-            print(f"      {sub_icon} {parallel_marker} {subtask['id']}: {subtask['name']}{dep_info}")
-        print()
+            out.append(f"      {sub_icon} {parallel_marker} {subtask['id']}: {subtask['name']}{dep_info}")
+        out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
+
+def _index_tasks(data):
+    """Map every task and subtask ID to its entry for direct lookup"""
+    index = {}
+    for task in data['tasks']:
+        index[task['id']] = ('task', task)
+        for subtask in task['subtasks']:
+            index[subtask['id']] = ('subtask', subtask)
+    return index
 
 def start_task(task_id):
     """Mark a task as in progress"""
@@ -65,25 +98,16 @@ def start_task(task_id):
     if not data:
         return
     
-    # Find and update task
-    for task in data['tasks']:
-        if task['id'] == task_id:
-            task['status'] = 'in_progress'
-            task['started_at'] = datetime.now().isoformat()
-            save_tasks(data)
-            print(f"✅ Started task {task_id}: {task['name']}")
-            return
-        
-        # Check subtasks
-        for subtask in task['subtasks']:
-            if subtask['id'] == task_id:
-                subtask['status'] = 'in_progress'
-                subtask['started_at'] = datetime.now().isoformat()
-                save_tasks(data)
-                print(f"✅ Started subtask {task_id}: {subtask['name']}")
-                return
+    entry = _index_tasks(data).get(task_id)
+    if entry is None:
+        print(f"❌ Task {task_id} not found!")
+        return
     
-    print(f"❌ Task {task_id} not found!")
+    kind, item = entry
+    item['status'] = 'in_progress'
+    item['started_at'] = datetime.now().isoformat()
+    save_tasks(data)
+    print(f"✅ Started {kind} {task_id}: {item['name']}")
 
 def complete_task(task_id):
     """Mark a task as completed"""
@@ -91,25 +115,16 @@ def complete_task(task_id):
     if not data:
         return
     
-    # Find and update task
-    for task in data['tasks']:
-        if task['id'] == task_id:
-            task['status'] = 'completed'
-            task['completed_at'] = datetime.now().isoformat()
-            save_tasks(data)
-            print(f"🎉 Completed task {task_id}: {task['name']}")
-            return
-        
-        # Check subtasks
-        for subtask in task['subtasks']:
-            if subtask['id'] == task_id:
-                subtask['status'] = 'completed'
-                subtask['completed_at'] = datetime.now().isoformat()
-                save_tasks(data)
-                print(f"🎉 Completed subtask {task_id}: {subtask['name']}")
-                return
+    entry = _index_tasks(data).get(task_id)
+    if entry is None:
+        print(f"❌ Task {task_id} not found!")
+        return
     
-    print(f"❌ Task {task_id} not found!")
+    kind, item = entry
+    item['status'] = 'completed'
+    item['completed_at'] = datetime.now().isoformat()
+    save_tasks(data)
+    print(f"🎉 Completed {kind} {task_id}: {item['name']}")
 
 def show_execution_plan():
     """Show execution plan with parallel and sequential ordering"""
@@ -117,39 +132,39 @@ def show_execution_plan():
     if not data:
         return
 
-    print(f"\n🎯 {data['project']} Execution Plan")
-    print("=" * 50)
+    out = []
+    out.append(f"\n🎯 {data['project']} Execution Plan")
+    out.append("=" * 50)
 
     for task in data['tasks']:
-        print(f"\n📋 {task['id']}: {task['name']}")
+        out.append(f"\n📋 {task['id']}: {task['name']}")
 
-        # Group subtasks by execution order
+        # Group subtasks by execution order into (parallel, sequential) lists
         order_groups = {}
         for subtask in task['subtasks']:
             order = subtask.get('execution_order', 1)
-            if order not in order_groups:
-                order_groups[order] = []
-            order_groups[order].append(subtask)
+            group = order_groups.setdefault(order, ([], []))
+            group[0 if subtask.get('parallel', False) else 1].append(subtask)
 
         # Display by execution order
-        for order in sorted(order_groups.keys()):
-            print(f"\n   Phase {order}:")
-            parallel_tasks = [st for st in order_groups[order] if st.get('parallel', False)]
-            sequential_tasks = [st for st in order_groups[order] if not st.get('parallel', False)]
+        for order, (parallel_tasks, sequential_tasks) in sorted(order_groups.items()):
+            out.append(f"\n   Phase {order}:")
 
             if parallel_tasks:
-                print("   🔀 Parallel execution (can run simultaneously):")
+                out.append("   🔀 Parallel execution (can run simultaneously):")
                 for subtask in parallel_tasks:
                     deps = subtask.get('dependencies', [])
                     dep_info = f" (after: {', '.join(deps)})" if deps else ""
-                    print(f"      • {subtask['id']}: {subtask['name']}{dep_info}")
+                    out.append(f"      • {subtask['id']}: {subtask['name']}{dep_info}")
 
             if sequential_tasks:
-                print("   ➡️  Sequential execution:")
+                out.append("   ➡️  Sequential execution:")
                 for subtask in sequential_tasks:
                     deps = subtask.get('dependencies', [])
                     dep_info = f" (after: {', '.join(deps)})" if deps else ""
-                    print(f"      • {subtask['id']}: {subtask['name']}{dep_info}")
+                    out.append(f"      • {subtask['id']}: {subtask['name']}{dep_info}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 def show_help():
     """Show help information"""
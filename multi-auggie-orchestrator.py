@@ -9,14 +9,22 @@ on different components of a project, all coordinated through shared specificati
 import asyncio
 import json
 import os
+import re
 import subprocess
+import heapq
 import tempfile
 import shutil
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 class TaskStatus(Enum):
     PENDING = "pending"
     ASSIGNED = "assigned"
@@ -25,7 +33,7 @@ class TaskStatus(Enum):
     FAILED = "failed"
     BLOCKED = "blocked"
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: str
     description: str
@@ -38,7 +46,7 @@ class Task:
     assigned_agent: Optional[str] = None
     output_path: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class AuggieAgent:
     id: str
     name: str
@@ -47,6 +55,67 @@ class AuggieAgent:
     status: str = "idle"
     current_task: Optional[str] = None
 
+# Prompt sent to each agent; filled in per task by _build_auggie_command
+_PROMPT_TEMPLATE = """
+You are {name}, specialized in {spec}.
+
+Task: {desc}
+Component: {comp}
+Files to work on: {files}
+
+Follow the specifications in specs/ directory.
+Apply the constitution from memory/constitution.md.
+
+Focus on your specialization: {spec}
+Coordinate with other agents through shared specifications.
+
+Implement this task: {desc}
+"""
+
+def _split_list(value: str) -> List[str]:
+    """Split a comma-separated markdown field into stripped, non-empty items."""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+# **Field:** lines inside a task block, and how each one is stored on the task dict
+_FIELD_RE = re.compile(r'^\*\*(Description|Files|Dependencies|Component):\*\*(.*)$')
+_FIELD_HANDLERS = {
+    'Description': lambda task, value: task.__setitem__('description', value.strip()),
+    'Files': lambda task, value: task.__setitem__('files', _split_list(value)),
+    'Dependencies': lambda task, value: task.__setitem__('dependencies', _split_list(value)),
+    'Component': lambda task, value: task.__setitem__('component', value.strip()),
+}
+
+# Linux FICLONE ioctl: share a file's extents copy-on-write (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+def _clone_file(source, target) -> None:
+    """Copy one file, as a reflink when the filesystem supports it.
+
+    A reflink is as cheap as a hard link but stays copy-on-write, so each
+    agent still gets its own private copy. Falls back to shutil.copy2.
+    """
+    # Unlink instead of truncating: an existing target may share its inode with
+    # the project original (workspaces mirrored with hard links)
+    if os.path.lexists(target):
+        os.unlink(target)
+    if fcntl is not None:
+        try:
+            with open(source, 'rb') as src, open(target, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            shutil.copystat(source, target)
+            return
+        except OSError:
+            pass
+    shutil.copy2(source, target)
+
+def _fast_mirror(src: Path, dst: Path) -> None:
+    """Copy a directory tree into an agent workspace, reflinking files where possible.
+
+    Every agent gets independent copies it may edit freely; results only
+    reach the shared project through _merge_task_results.
+    """
+    shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=_clone_file)
+
 class MultiAuggieOrchestrator:
     def __init__(self, project_root: Path, spec_dir: Path):
         self.project_root = project_root
@@ -54,17 +123,29 @@ class MultiAuggieOrchestrator:
         self.agents: Dict[str, AuggieAgent] = {}
         self.tasks: Dict[str, Task] = {}
         self.shared_context = {}
+        # Dependency DAG: successors per task, unmet dependency counts, and
+        # a heap of tasks whose dependencies are all completed
+        self._successors: Dict[str, List[str]] = {}
+        self._indegree: Dict[str, int] = {}
+        self._dependent_count: Dict[str, int] = {}
+        self._ready_queue: List[Tuple[int, int, str]] = []
+        # Number of tasks in each status, kept current by _set_task_status
+        self._status_counts: Counter = Counter()
+        # Files held by assigned/running tasks: file path -> IDs of every holder
+        self._locked_files: Dict[str, Set[str]] = {}
+        # Specialization match score per task and agent: task ID -> agent ID -> score
+        self._agent_scores: Dict[str, Dict[str, int]] = {}
+        # execute_task coroutines currently in flight
+        self._running: set = set()
         
     async def initialize_agents(self, agent_configs: List[Dict]) -> None:
         """Initialize multiple AUGGIE agents with different specializations."""
+        new_agents = []
         for config in agent_configs:
             agent_id = config["id"]
             working_dir = self.project_root / f"work-{agent_id}"
             working_dir.mkdir(exist_ok=True)
             
-            # Copy shared specifications to each agent's workspace
-            await self._setup_agent_workspace(working_dir)
-            
             agent = AuggieAgent(
                 id=agent_id,
                 name=config["name"],
@@ -72,22 +153,32 @@ class MultiAuggieOrchestrator:
                 working_dir=working_dir
             )
             self.agents[agent_id] = agent
+            new_agents.append(agent)
+        
+        self._agent_scores.clear()
+        
+        # Copy shared specifications to every agent's workspace concurrently
+        await asyncio.gather(*(self._setup_agent_workspace(agent.working_dir) for agent in new_agents))
             
     async def _setup_agent_workspace(self, working_dir: Path) -> None:
         """Setup workspace with shared specifications and context."""
+        await asyncio.to_thread(self._setup_agent_workspace_sync, working_dir)
+
+    def _setup_agent_workspace_sync(self, working_dir: Path) -> None:
+        """Blocking part of _setup_agent_workspace; runs in a worker thread."""
         # Copy specifications
         if self.spec_dir.exists():
-            shutil.copytree(self.spec_dir, working_dir / "specs", dirs_exist_ok=True)
+            _fast_mirror(self.spec_dir, working_dir / "specs")
         
         # Copy constitution and memory
         memory_dir = self.project_root / "memory"
         if memory_dir.exists():
-            shutil.copytree(memory_dir, working_dir / "memory", dirs_exist_ok=True)
+            _fast_mirror(memory_dir, working_dir / "memory")
             
         # Copy templates
         templates_dir = self.project_root / "templates"
         if templates_dir.exists():
-            shutil.copytree(templates_dir, working_dir / "templates", dirs_exist_ok=True)
+            _fast_mirror(templates_dir, working_dir / "templates")
 
     async def load_tasks_from_spec(self, tasks_file: Path) -> None:
         """Load and parse tasks from the generated tasks.md file."""
@@ -96,22 +187,107 @@ class MultiAuggieOrchestrator:
             
         # Parse tasks.md and extract structured task information
         # This would parse the markdown and create Task objects
-        tasks_content = tasks_file.read_text()
-        parsed_tasks = self._parse_tasks_markdown(tasks_content)
+        with tasks_file.open('r', buffering=1024 * 1024) as f:
+            parsed_tasks = self._parse_tasks_markdown_stream(f)
         
         for task_data in parsed_tasks:
             task = Task(**task_data)
             self.tasks[task.id] = task
 
+        self._status_counts = Counter(task.status for task in self.tasks.values())
+        self._agent_scores = {task.id: self._score_agents(task) for task in self.tasks.values()}
+
+        self._build_task_graph()
+
+    def _set_task_status(self, task: Task, status: TaskStatus) -> None:
+        """Move a task to a new status, keeping the per-status counters in sync."""
+        self._status_counts[task.status] -= 1
+        task.status = status
+        self._status_counts[status] += 1
+
+    def _build_task_graph(self) -> None:
+        """Build the dependency DAG and seed the ready queue (Kahn's algorithm)."""
+        self._successors = {task_id: [] for task_id in self.tasks}
+        self._indegree = {task_id: 0 for task_id in self.tasks}
+
+        for task in self.tasks.values():
+            # Dependencies on unknown tasks don't block, matching the old polling check
+            for dep_id in task.dependencies:
+                if dep_id in self.tasks:
+                    self._successors[dep_id].append(task.id)
+                    self._indegree[task.id] += 1
+
+        self._check_for_cycles()
+        self._dependent_count = {task_id: self._count_dependents(task_id) for task_id in self.tasks}
+
+        self._ready_queue = []
+        for task_id, count in self._indegree.items():
+            if count == 0 and self.tasks[task_id].status == TaskStatus.PENDING:
+                self._push_ready(task_id)
+
+    def _check_for_cycles(self) -> None:
+        """Raise ValueError if the task dependencies contain a cycle."""
+        indegree = dict(self._indegree)
+        stack = [task_id for task_id, count in indegree.items() if count == 0]
+        emitted = 0
+        while stack:
+            task_id = stack.pop()
+            emitted += 1
+            for successor_id in self._successors[task_id]:
+                indegree[successor_id] -= 1
+                if indegree[successor_id] == 0:
+                    stack.append(successor_id)
+
+        if emitted < len(self.tasks):
+            remaining_ids = sorted(task_id for task_id, count in indegree.items() if count > 0)
+            raise ValueError(f"Dependency cycle detected among: {', '.join(remaining_ids)}")
+
+    def _count_dependents(self, task_id: str) -> int:
+        """Count the tasks that transitively depend on task_id."""
+        seen = set()
+        stack = list(self._successors[task_id])
+        while stack:
+            successor_id = stack.pop()
+            if successor_id not in seen:
+                seen.add(successor_id)
+                stack.extend(self._successors[successor_id])
+        return len(seen)
+
+    def _push_ready(self, task_id: str) -> None:
+        """Queue a ready task, prioritising tasks that unblock the most work."""
+        task = self.tasks[task_id]
+        priority = (-self._dependent_count[task_id], -task.estimated_effort, task_id)
+        heapq.heappush(self._ready_queue, priority)
+
+    def _release_successors(self, task: Task) -> None:
+        """Mark a completed task's dependency edges as satisfied."""
+        for successor_id in self._successors.get(task.id, []):
+            self._indegree[successor_id] -= 1
+            if self._indegree[successor_id] == 0:
+                self._push_ready(successor_id)
+
+    def _block_successors(self, task: Task) -> None:
+        """Mark every task that transitively depends on a failed task as blocked."""
+        stack = list(self._successors.get(task.id, []))
+        while stack:
+            successor = self.tasks[stack.pop()]
+            if successor.status == TaskStatus.PENDING:
+                self._set_task_status(successor, TaskStatus.BLOCKED)
+                stack.extend(self._successors.get(successor.id, []))
+
     def _parse_tasks_markdown(self, content: str) -> List[Dict]:
         """Parse tasks.md markdown format into structured task data."""
+        return self._parse_tasks_markdown_stream(content.splitlines())
+
+    def _parse_tasks_markdown_stream(self, lines: Iterable[str]) -> List[Dict]:
+        """Parse tasks.md lines (e.g. an open file) without holding the whole file."""
         # Implementation would parse the specific format from spec-kit
         # This is a simplified version
         tasks = []
-        lines = content.split('\n')
         
         current_task = None
         for line in lines:
+            line = line.rstrip('\n')
             if line.startswith('### T'):  # Task header
                 if current_task:
                     tasks.append(current_task)
@@ -126,81 +302,110 @@ class MultiAuggieOrchestrator:
                     'parallel_safe': '[P]' in line,
                     'estimated_effort': 1
                 }
-            elif current_task and line.strip():
-                if line.startswith('**Description:**'):
-                    current_task['description'] = line.replace('**Description:**', '').strip()
-                elif line.startswith('**Files:**'):
-                    files_str = line.replace('**Files:**', '').strip()
-                    current_task['files'] = [f.strip() for f in files_str.split(',') if f.strip()]
-                elif line.startswith('**Dependencies:**'):
-                    deps_str = line.replace('**Dependencies:**', '').strip()
-                    current_task['dependencies'] = [d.strip() for d in deps_str.split(',') if d.strip()]
-                elif line.startswith('**Component:**'):
-                    current_task['component'] = line.replace('**Component:**', '').strip()
+            elif current_task:
+                match = _FIELD_RE.match(line)
+                if match:
+                    _FIELD_HANDLERS[match.group(1)](current_task, match.group(2))
         
         if current_task:
             tasks.append(current_task)
             
         return tasks
 
-    async def assign_tasks(self) -> None:
-        """Intelligently assign tasks to agents based on specialization and dependencies."""
-        available_tasks = [t for t in self.tasks.values() if t.status == TaskStatus.PENDING]
-        
-        # Sort by dependencies and specialization match
-        for task in available_tasks:
+    async def assign_tasks(self) -> List[Tuple[AuggieAgent, Task]]:
+        """Intelligently assign tasks to agents based on specialization and dependencies.
+
+        Returns the (agent, task) pairs assigned in this round.
+        """
+        # Only tasks whose dependencies are all completed are in the ready queue
+        assigned = []
+        deferred = []
+        while self._ready_queue:
+            task = self.tasks[heapq.heappop(self._ready_queue)[-1]]
+            # A queued task may have been blocked since it became ready
+            if task.status != TaskStatus.PENDING:
+                continue
             best_agent = self._find_best_agent_for_task(task)
-            if best_agent and self._can_assign_task(task):
-                task.status = TaskStatus.ASSIGNED
-                task.assigned_agent = best_agent.id
-                best_agent.current_task = task.id
-                print(f"Assigned task {task.id} to agent {best_agent.name}")
+            if not best_agent:
+                deferred.append(task.id)
+                break
+            if not self._can_assign_task(task):
+                deferred.append(task.id)
+                continue
+
+            self._set_task_status(task, TaskStatus.ASSIGNED)
+            task.assigned_agent = best_agent.id
+            best_agent.current_task = task.id
+            self._lock_files(task)
+            assigned.append((best_agent, task))
+            print(f"Assigned task {task.id} to agent {best_agent.name}")
+
+        # Keep tasks that couldn't be placed for the next round
+        for task_id in deferred:
+            self._push_ready(task_id)
+        
+        return assigned
 
     def _find_best_agent_for_task(self, task: Task) -> Optional[AuggieAgent]:
         """Find the best agent for a task based on specialization and availability."""
-        available_agents = [a for a in self.agents.values() if a.status == "idle"]
+        available_agents = [a for a in self.agents.values()
+                            if a.status == "idle" and a.current_task is None]
         
         if not available_agents:
             return None
             
-        # Score agents based on specialization match
-        scored_agents = []
-        for agent in available_agents:
+        scores = self._agent_scores.get(task.id)
+        if scores is None:
+            scores = self._agent_scores[task.id] = self._score_agents(task)
+        
+        # Return highest scoring agent
+        return max(available_agents, key=lambda agent: scores[agent.id])
+
+    def _score_agents(self, task: Task) -> Dict[str, int]:
+        """Score every agent on how well its specialization matches a task."""
+        component = task.component.lower()
+        description = task.description.lower()
+        scores = {}
+        for agent in self.agents.values():
             score = 0
-            if agent.specialization in task.component.lower():
+            if agent.specialization in component:
                 score += 10
-            if agent.specialization in task.description.lower():
+            if agent.specialization in description:
                 score += 5
-            scored_agents.append((score, agent))
-        
-        # Return highest scoring agent
-        scored_agents.sort(key=lambda x: x[0], reverse=True)
-        return scored_agents[0][1] if scored_agents else None
+            scores[agent.id] = score
+        return scores
 
     def _can_assign_task(self, task: Task) -> bool:
-        """Check if a task can be assigned (dependencies met, no conflicts)."""
-        # Check dependencies
-        for dep_id in task.dependencies:
-            if dep_id in self.tasks:
-                dep_task = self.tasks[dep_id]
-                if dep_task.status != TaskStatus.COMPLETED:
-                    return False
-        
+        """Check if a task can be assigned (no file conflicts).
+
+        Dependencies are already satisfied for anything in the ready queue.
+        """
         # Check file conflicts
         if not task.parallel_safe:
-            for other_task in self.tasks.values():
-                if (other_task.status == TaskStatus.IN_PROGRESS and 
-                    other_task.id != task.id and
-                    set(task.files) & set(other_task.files)):
-                    return False
+            return not any(self._locked_files.get(f, {task.id}) - {task.id} for f in task.files)
         
         return True
 
+    def _lock_files(self, task: Task) -> None:
+        """Claim a task's files so conflicting tasks wait until it finishes."""
+        for file_path in task.files:
+            self._locked_files.setdefault(file_path, set()).add(task.id)
+
+    def _unlock_files(self, task: Task) -> None:
+        """Release the files claimed by a task; other running holders keep their claim."""
+        for file_path in task.files:
+            holders = self._locked_files.get(file_path)
+            if holders is None:
+                continue
+            holders.discard(task.id)
+            if not holders:
+                del self._locked_files[file_path]
+
     async def execute_task(self, agent: AuggieAgent, task: Task) -> bool:
         """Execute a task using the specified AUGGIE agent."""
         print(f"Agent {agent.name} starting task {task.id}: {task.description}")
         
-        task.status = TaskStatus.IN_PROGRESS
+        self._set_task_status(task, TaskStatus.IN_PROGRESS)
         agent.status = "working"
         
         try:
@@ -211,50 +416,47 @@ class MultiAuggieOrchestrator:
             result = await self._run_auggie_command(agent.working_dir, command)
             
             if result.returncode == 0:
-                task.status = TaskStatus.COMPLETED
+                self._set_task_status(task, TaskStatus.COMPLETED)
                 task.output_path = str(agent.working_dir / "output")
                 print(f"✅ Agent {agent.name} completed task {task.id}")
                 
                 # Merge results back to main project
                 await self._merge_task_results(agent, task)
+                # Only a merged result may unblock dependents
+                self._release_successors(task)
                 return True
             else:
-                task.status = TaskStatus.FAILED
+                self._set_task_status(task, TaskStatus.FAILED)
+                self._block_successors(task)
                 print(f"❌ Agent {agent.name} failed task {task.id}: {result.stderr}")
                 return False
                 
         except Exception as e:
-            task.status = TaskStatus.FAILED
+            self._set_task_status(task, TaskStatus.FAILED)
+            self._block_successors(task)
             print(f"❌ Agent {agent.name} error on task {task.id}: {e}")
             return False
         finally:
+            self._unlock_files(task)
             agent.status = "idle"
             agent.current_task = None
 
-    def _build_auggie_command(self, agent: AuggieAgent, task: Task) -> str:
-        """Build the AUGGIE CLI command for the specific task."""
-        context = f"""
-        You are {agent.name}, specialized in {agent.specialization}.
-        
-        Task: {task.description}
-        Component: {task.component}
-        Files to work on: {', '.join(task.files)}
-        
-        Follow the specifications in specs/ directory.
-        Apply the constitution from memory/constitution.md.
-        
-        Focus on your specialization: {agent.specialization}
-        Coordinate with other agents through shared specifications.
-        
-        Implement this task: {task.description}
-        """
-        
-        return f'auggie --print "{context}"'
+    def _build_auggie_command(self, agent: AuggieAgent, task: Task) -> List[str]:
+        """Build the AUGGIE CLI argv for the specific task."""
+        context = _PROMPT_TEMPLATE.format(
+            name=agent.name,
+            spec=agent.specialization,
+            desc=task.description,
+            comp=task.component,
+            files=', '.join(task.files),
+        )
+        return ["auggie", "--print", context]
 
-    async def _run_auggie_command(self, working_dir: Path, command: str) -> subprocess.CompletedProcess:
+    async def _run_auggie_command(self, working_dir: Path, command: List[str]) -> subprocess.CompletedProcess:
         """Run AUGGIE CLI command in the agent's workspace."""
-        process = await asyncio.create_subprocess_shell(
-            command,
+        # Exec auggie directly: no intermediate /bin/sh and no shell quoting of the prompt
+        process = await asyncio.create_subprocess_exec(
+            *command,
             cwd=working_dir,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
@@ -282,43 +484,43 @@ class MultiAuggieOrchestrator:
                 print(f"📁 Merged {file_path} from agent {agent.name}")
 
     async def orchestrate(self) -> None:
-        """Main orchestration loop."""
+        """Main orchestration loop.
+
+        Event-driven: whenever a running task finishes, the newly ready tasks
+        are assigned and started straight away, without waiting for the rest.
+        """
         print("🚀 Starting Multi-AUGGIE Orchestration")
         
         while True:
-            # Assign new tasks
-            await self.assign_tasks()
+            # Assign new tasks and start them in parallel with those already running
+            for agent, task in await self.assign_tasks():
+                self._running.add(asyncio.create_task(self.execute_task(agent, task)))
             
-            # Execute tasks in parallel
-            active_tasks = []
-            for agent in self.agents.values():
-                if agent.current_task:
-                    task = self.tasks[agent.current_task]
-                    if task.status == TaskStatus.ASSIGNED:
-                        active_tasks.append(self.execute_task(agent, task))
-            
-            if active_tasks:
-                # Wait for at least one task to complete
-                done, pending = await asyncio.wait(active_tasks, return_when=asyncio.FIRST_COMPLETED)
-                
-                # Cancel remaining tasks for this iteration
-                for task in pending:
-                    task.cancel()
+            if not self._running:
+                break
             
-            # Check if all tasks are complete
+            # Sleep until at least one task completes
+            _, self._running = await asyncio.wait(self._running, return_when=asyncio.FIRST_COMPLETED)
+        
+        # Check if all tasks are complete
+        finished = sum(self._status_counts[status]
+                       for status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.BLOCKED))
+        
+        if finished < len(self.tasks):
             remaining_tasks = [t for t in self.tasks.values() 
-                            if t.status not in [TaskStatus.COMPLETED, TaskStatus.FAILED]]
-            
-            if not remaining_tasks:
-                print("🎉 All tasks completed!")
-                break
-                
-            # Brief pause before next iteration
-            await asyncio.sleep(1)
+                            if t.status not in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.BLOCKED]]
+            print(f"⚠️  Unable to schedule tasks: {', '.join(t.id for t in remaining_tasks)}")
+        else:
+            print("🎉 All tasks completed!")
+
+    def get_status_report(self, include_tasks: bool = True) -> Dict:
+        """Generate a status report of all agents and tasks.
 
-    def get_status_report(self) -> Dict:
-        """Generate a status report of all agents and tasks."""
-        return {
+        Per-status task counts are always included; pass include_tasks=False to
+        skip building the per-task breakdown.
+        """
+        report = {
+            "counts": {status.value: count for status, count in self._status_counts.items() if count},
             "agents": {
                 agent_id: {
                     "name": agent.name,
@@ -327,8 +529,10 @@ class MultiAuggieOrchestrator:
                     "current_task": agent.current_task
                 }
                 for agent_id, agent in self.agents.items()
-            },
-            "tasks": {
+            }
+        }
+        if include_tasks:
+            report["tasks"] = {
                 task_id: {
                     "description": task.description,
                     "status": task.status.value,
@@ -337,7 +541,7 @@ class MultiAuggieOrchestrator:
                 }
                 for task_id, task in self.tasks.items()
             }
-        }
+        return report
 
 # Example usage
 async def main():
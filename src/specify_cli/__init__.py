@@ -25,37 +25,64 @@ Or install globally:
 import os
 import subprocess
 import sys
-import zipfile
+import time
 import tempfile
 import shutil
+import stat
 import json
+import functools
+import contextlib
+import atexit
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-import httpx
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
-from rich.live import Live
 from rich.align import Align
-from rich.table import Table
-from rich.tree import Tree
 from typer.core import TyperGroup
 
-# For cross-platform keyboard input
-import readchar
-import ssl
-import truststore
+# httpx, truststore, readchar, zipfile and the heavier rich widgets (progress,
+# live, table, tree) are imported where they are used so `specify --help` and the
+# brownfield commands don't pay for them, nor for loading the OS trust store.
+if TYPE_CHECKING:
+    import ssl
+    import zipfile
+    import httpx
 
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-client = httpx.Client(verify=ssl_context)
+
+@functools.lru_cache(maxsize=None)
+def _get_ssl_context() -> "ssl.SSLContext":
+    """Return the process-wide truststore SSL context (loading OS roots is costly)."""
+    import ssl
+    import truststore
+
+    return truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+
+def _get_client(verify: bool = True) -> "httpx.Client":
+    """Return the shared HTTP client for this TLS setting so every request reuses pooled connections."""
+    # Normalise here: lru_cache keys f(), f(True) and f(verify=True) separately
+    return _client_for(bool(verify))
+
+
+@functools.lru_cache(maxsize=None)
+def _client_for(verify: bool) -> "httpx.Client":
+    import httpx
+
+    client = httpx.Client(
+        verify=_get_ssl_context() if verify else False,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+    atexit.register(client.close)
+    return client
 
 # Constants - AUGGIE-Only Enhanced Spec-Kit
 AI_CHOICES = {
     "auggie": "Augment AUGGIE CLI - Enhanced Spec-Driven Development"
 }
+_AI_SET = frozenset(AI_CHOICES)
 
 # Claude CLI local installation path after migrate-installer
 CLAUDE_LOCAL_PATH = Path.home() / ".claude" / "local" / "claude"
@@ -71,6 +98,20 @@ BANNER = """
 """
 
 TAGLINE = "Spec-Driven Development Toolkit"
+
+# Template download read size, and the minimum seconds between progress bar updates
+_DOWNLOAD_CHUNK_SIZE = 1 << 18
+_PROGRESS_INTERVAL = 1 / 30
+
+# Status circles used by StepTracker.render
+_STEP_SYMBOLS = {
+    "done": "[green]●[/green]",
+    "pending": "[green dim]○[/green dim]",
+    "running": "[cyan]○[/cyan]",
+    "error": "[red]●[/red]",
+    "skipped": "[yellow]○[/yellow]",
+}
+
 class StepTracker:
     """Track and render hierarchical steps without emojis, similar to Claude Code tree output.
     Supports live auto-refresh via an attached refresh callback.
@@ -78,6 +119,7 @@ class StepTracker:
     def __init__(self, title: str):
         self.title = title
         self.steps = []  # list of dicts: {key, label, status, detail}
+        self._index = {}  # key -> step dict in self.steps
         self.status_order = {"pending": 0, "running": 1, "done": 2, "error": 3, "skipped": 4}
         self._refresh_cb = None  # callable to trigger UI refresh
 
@@ -85,8 +127,8 @@ class StepTracker:
         self._refresh_cb = cb
 
     def add(self, key: str, label: str):
-        if key not in [s["key"] for s in self.steps]:
-            self.steps.append({"key": key, "label": label, "status": "pending", "detail": ""})
+        if key not in self._index:
+            self._append(key, label, "pending", "")
             self._maybe_refresh()
 
     def start(self, key: str, detail: str = ""):
@@ -102,17 +144,22 @@ class StepTracker:
         self._update(key, status="skipped", detail=detail)
 
     def _update(self, key: str, status: str, detail: str):
-        for s in self.steps:
-            if s["key"] == key:
-                s["status"] = status
-                if detail:
-                    s["detail"] = detail
-                self._maybe_refresh()
-                return
-        # If not present, add it
-        self.steps.append({"key": key, "label": key, "status": status, "detail": detail})
+        detail = detail.strip() if detail else ""
+        s = self._index.get(key)
+        if s is not None:
+            s["status"] = status
+            if detail:
+                s["detail"] = detail
+        else:
+            # If not present, add it
+            self._append(key, key, status, detail)
         self._maybe_refresh()
 
+    def _append(self, key: str, label: str, status: str, detail: str):
+        step = {"key": key, "label": label, "status": status, "detail": detail}
+        self.steps.append(step)
+        self._index[key] = step
+
     def _maybe_refresh(self):
         if self._refresh_cb:
             try:
@@ -121,25 +168,17 @@ class StepTracker:
                 pass
 
     def render(self):
+        from rich.tree import Tree
+
         tree = Tree(f"[bold cyan]{self.title}[/bold cyan]", guide_style="grey50")
         for step in self.steps:
             label = step["label"]
-            detail_text = step["detail"].strip() if step["detail"] else ""
+            # Details are stripped once in _update
+            detail_text = step["detail"]
 
             # Circles (unchanged styling)
             status = step["status"]
-            if status == "done":
-                symbol = "[green]●[/green]"
-            elif status == "pending":
-                symbol = "[green dim]○[/green dim]"
-            elif status == "running":
-                symbol = "[cyan]○[/cyan]"
-            elif status == "error":
-                symbol = "[red]●[/red]"
-            elif status == "skipped":
-                symbol = "[yellow]○[/yellow]"
-            else:
-                symbol = " "
+            symbol = _STEP_SYMBOLS.get(status, " ")
 
             if status == "pending":
                 # Entire line light gray (pending)
@@ -165,29 +204,27 @@ MINI_BANNER = """
 ╚═╝╩  ╚═╝╚═╝╩╚   ╩ 
 """
 
+@functools.cache
+def _keymap() -> dict[str, str]:
+    """Map readchar key codes to the names select_with_arrows understands (built after the lazy import)."""
+    import readchar
+
+    return {
+        readchar.key.UP: 'up',
+        readchar.key.DOWN: 'down',
+        readchar.key.ENTER: 'enter',
+        readchar.key.ESC: 'escape',
+    }
+
+
 def get_key():
     """Get a single keypress in a cross-platform way using readchar."""
+    import readchar
+
     key = readchar.readkey()
-    
-    # Arrow keys
-    if key == readchar.key.UP:
-        return 'up'
-    if key == readchar.key.DOWN:
-        return 'down'
-    
-    # Enter/Return
-    if key == readchar.key.ENTER:
-        return 'enter'
-    
-    # Escape
-    if key == readchar.key.ESC:
-        return 'escape'
-        
-    # Ctrl+C
     if key == readchar.key.CTRL_C:
         raise KeyboardInterrupt
-
-    return key
+    return _keymap().get(key, key)
 
 
 
@@ -203,6 +240,9 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
     Returns:
         Selected option key
     """
+    from rich.live import Live
+    from rich.table import Table
+
     option_keys = list(options.keys())
     if default_key and default_key in option_keys:
         selected_index = option_keys.index(default_key)
@@ -211,17 +251,18 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
     
     selected_key = None
 
+    # Format every row in both states once; keypresses only pick between them
+    selected_rows = [("▶", f"[bright_cyan]{key}: {options[key]}[/bright_cyan]") for key in option_keys]
+    unselected_rows = [(" ", f"[white]{key}: {options[key]}[/white]") for key in option_keys]
+
     def create_selection_panel():
         """Create the selection panel with current selection highlighted."""
         table = Table.grid(padding=(0, 2))
         table.add_column(style="bright_cyan", justify="left", width=3)
         table.add_column(style="white", justify="left")
         
-        for i, key in enumerate(option_keys):
-            if i == selected_index:
-                table.add_row("▶", f"[bright_cyan]{key}: {options[key]}[/bright_cyan]")
-            else:
-                table.add_row(" ", f"[white]{key}: {options[key]}[/white]")
+        for i in range(len(option_keys)):
+            table.add_row(*(selected_rows[i] if i == selected_index else unselected_rows[i]))
         
         table.add_row("", "")
         table.add_row("", "[dim]Use ↑/↓ to navigate, Enter to select, Esc to cancel[/dim]")
@@ -290,8 +331,9 @@ app = typer.Typer(
 )
 
 
-def show_banner():
-    """Display the ASCII art banner."""
+@functools.cache
+def _banner_renderables() -> tuple[Align, Align]:
+    """Build the styled banner and tagline once; both are constant."""
     # Create gradient effect with different colors
     banner_lines = BANNER.strip().split('\n')
     colors = ["bright_blue", "blue", "cyan", "bright_cyan", "white", "bright_white"]
@@ -301,8 +343,14 @@ def show_banner():
         color = colors[i % len(colors)]
         styled_banner.append(line + "\n", style=color)
     
-    console.print(Align.center(styled_banner))
-    console.print(Align.center(Text(TAGLINE, style="italic bright_yellow")))
+    return Align.center(styled_banner), Align.center(Text(TAGLINE, style="italic bright_yellow"))
+
+
+def show_banner():
+    """Display the ASCII art banner."""
+    banner, tagline = _banner_renderables()
+    console.print(banner)
+    console.print(tagline)
     console.print()
 
 
@@ -336,6 +384,21 @@ def run_command(cmd: list[str], check_return: bool = True, capture: bool = False
         return None
 
 
+@functools.lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    """shutil.which, memoized for the lifetime of the process (each lookup walks PATH)."""
+    return shutil.which(tool)
+
+
+@functools.lru_cache(maxsize=None)
+def _claude_local_installed() -> bool:
+    """Whether the migrate-installer Claude CLI exists at CLAUDE_LOCAL_PATH."""
+    try:
+        return stat.S_ISREG(CLAUDE_LOCAL_PATH.stat().st_mode)
+    except OSError:
+        return False
+
+
 def check_tool(tool: str, install_hint: str) -> bool:
     """Check if a tool is installed."""
     
@@ -345,10 +408,10 @@ def check_tool(tool: str, install_hint: str) -> bool:
     # and creates an alias at ~/.claude/local/claude instead
     # This path should be prioritized over other claude executables in PATH
     if tool == "claude":
-        if CLAUDE_LOCAL_PATH.exists() and CLAUDE_LOCAL_PATH.is_file():
+        if _claude_local_installed():
             return True
     
-    if shutil.which(tool):
+    if _which(tool):
         return True
     else:
         console.print(f"[yellow]⚠️  {tool} not found[/yellow]")
@@ -364,6 +427,23 @@ def is_git_repo(path: Path = None) -> bool:
     if not path.is_dir():
         return False
 
+    # Look for a .git directory ourselves; only unusual layouts need a git subprocess
+    if "GIT_DIR" not in os.environ:
+        # Common case: path is the repository root, answered without resolving the path
+        if (path / ".git").is_dir():
+            return True
+        resolved = path.resolve()
+        for parent in (resolved, *resolved.parents):
+            try:
+                git_mode = (parent / ".git").stat().st_mode
+            except OSError:
+                continue
+            if stat.S_ISDIR(git_mode):
+                return True
+            break  # A .git file (worktree or submodule) is left to git
+        else:
+            return False
+
     try:
         # Use git command to check if inside a work tree
         subprocess.run(
@@ -382,13 +462,12 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> bool:
     quiet: if True suppress console output (tracker handles status)
     """
     try:
-        original_cwd = Path.cwd()
-        os.chdir(project_path)
         if not quiet:
             console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True)
-        subprocess.run(["git", "add", "."], check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit from Specify template"], check=True, capture_output=True)
+        # Run git in project_path via cwd= rather than os.chdir, which changes process-wide state
+        subprocess.run(["git", "init"], check=True, capture_output=True, cwd=project_path)
+        subprocess.run(["git", "add", "."], check=True, capture_output=True, cwd=project_path)
+        subprocess.run(["git", "commit", "-m", "Initial commit from Specify template"], check=True, capture_output=True, cwd=project_path)
         if not quiet:
             console.print("[green]✓[/green] Git repository initialized")
         return True
@@ -397,24 +476,59 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> bool:
         if not quiet:
             console.print(f"[red]Error initializing git repository:[/red] {e}")
         return False
-    finally:
-        os.chdir(original_cwd)
 
 
-def download_template_from_github(ai_assistant: str, download_dir: Path, *, verbose: bool = True, show_progress: bool = True, client: httpx.Client = None):
+def _release_cache_path() -> Path:
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("specify-cli")) / "release-latest.json"
+
+
+def _load_cached_release() -> tuple[Optional[str], Optional[dict]]:
+    """Return the (etag, release JSON) saved by the last successful lookup, if any."""
+    try:
+        cached = json.loads(_release_cache_path().read_bytes())
+        return cached["etag"], cached["release"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, None
+
+
+def _save_cached_release(etag: str, release_data: dict):
+    path = _release_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"etag": etag, "release": release_data}), encoding="utf-8")
+    except OSError:
+        pass  # The cache is only an optimization
+
+
+def download_template_from_github(ai_assistant: str, download_dir: Path, *, verbose: bool = True, show_progress: bool = True, client: "httpx.Client" = None):
+    import httpx
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     repo_owner = "github"
     repo_name = "spec-kit"
     if client is None:
-        client = httpx.Client(verify=ssl_context)
+        client = _get_client()
     
     if verbose:
         console.print("[cyan]Fetching latest release information...[/cyan]")
     api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
     
+    # Revalidate the last release we saw; a 304 lets us skip re-downloading and parsing the JSON
+    cached_etag, cached_release = _load_cached_release()
+    headers = {"If-None-Match": cached_etag} if cached_etag else None
+
     try:
-        response = client.get(api_url, timeout=30, follow_redirects=True)
-        response.raise_for_status()
-        release_data = response.json()
+        response = client.get(api_url, headers=headers, timeout=30, follow_redirects=True)
+        if response.status_code == 304 and cached_release is not None:
+            release_data = cached_release
+        else:
+            response.raise_for_status()
+            release_data = response.json()
+            etag = response.headers.get("etag")
+            if etag:
+                _save_cached_release(etag, release_data)
     except httpx.RequestError as e:
         if verbose:
             console.print(f"[red]Error fetching release information:[/red] {e}")
@@ -446,8 +560,8 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, verb
         console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
         console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
     
-    # Download the file
-    zip_path = download_dir / filename
+    # Download the file into memory; only unusually large archives spill to download_dir
+    archive = tempfile.SpooledTemporaryFile(max_size=64 << 20, dir=download_dir)
     if verbose:
         console.print(f"[cyan]Downloading template...[/cyan]")
     
@@ -455,33 +569,37 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, verb
         with client.stream("GET", download_url, timeout=30, follow_redirects=True) as response:
             response.raise_for_status()
             total_size = int(response.headers.get('content-length', 0))
-            with open(zip_path, 'wb') as f:
-                if total_size == 0:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                else:
-                    if show_progress:
-                        with Progress(
-                            SpinnerColumn(),
-                            TextColumn("[progress.description]{task.description}"),
-                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                            console=console,
-                        ) as progress:
-                            task = progress.add_task("Downloading...", total=total_size)
-                            downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=8192):
-                                f.write(chunk)
-                                downloaded += len(chunk)
+            if total_size == 0:
+                for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    archive.write(chunk)
+            else:
+                if show_progress:
+                    with Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                        console=console,
+                    ) as progress:
+                        task = progress.add_task("Downloading...", total=total_size)
+                        downloaded = 0
+                        last_update = time.monotonic()
+                        for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                            archive.write(chunk)
+                            downloaded += len(chunk)
+                            now = time.monotonic()
+                            if now - last_update >= _PROGRESS_INTERVAL:
                                 progress.update(task, completed=downloaded)
-                    else:
-                        for chunk in response.iter_bytes(chunk_size=8192):
-                            f.write(chunk)
+                                last_update = now
+                        progress.update(task, completed=downloaded)
+                else:
+                    for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        archive.write(chunk)
     except httpx.RequestError as e:
         if verbose:
             console.print(f"[red]Error downloading template:[/red] {e}")
-        if zip_path.exists():
-            zip_path.unlink()
+        archive.close()
         raise typer.Exit(1)
+    archive.seek(0)
     if verbose:
         console.print(f"Downloaded: {filename}")
     metadata = {
@@ -490,20 +608,53 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, verb
         "release": release_data["tag_name"],
         "asset_url": download_url
     }
-    return zip_path, metadata
+    return archive, metadata
+
+
+def _merge_zip_into_dir(zip_ref: "zipfile.ZipFile", infos: "list[zipfile.ZipInfo]", dest_root: Path, prefix: str = "", *, verbose: bool = False) -> None:
+    """Write archive entries under ``prefix`` into dest_root, merging with existing content."""
+    announced = set()
+    for info in infos:
+        if not info.filename.startswith(prefix):
+            continue
+        rel_name = info.filename[len(prefix):]
+        rel_path = Path(rel_name)
+        # Never write outside dest_root: any anchor (root or drive, which Windows
+        # does not count as absolute for "/x" and "C:x") or ".." component
+        if not rel_name or rel_path.anchor or ".." in rel_path.parts:
+            continue
+        
+        top = rel_path.parts[0]
+        if verbose and top not in announced:
+            announced.add(top)
+            if (dest_root / top).exists():
+                if len(rel_path.parts) > 1 or info.is_dir():
+                    console.print(f"[yellow]Merging directory:[/yellow] {top}")
+                else:
+                    console.print(f"[yellow]Overwriting file:[/yellow] {top}")
+        
+        target = dest_root / rel_path
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with zip_ref.open(info) as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
 
 
-def download_and_extract_template(project_path: Path, ai_assistant: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None) -> Path:
+def download_and_extract_template(project_path: Path, ai_assistant: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: "httpx.Client" = None) -> Path:
     """Download the latest release and extract it to create a new project.
     Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
     """
+    import zipfile
+
     current_dir = Path.cwd()
     
     # Step: fetch + download combined
     if tracker:
         tracker.start("fetch", "contacting GitHub API")
     try:
-        zip_path, meta = download_template_from_github(
+        archive, meta = download_template_from_github(
             ai_assistant,
             current_dir,
             verbose=verbose and tracker is None,
@@ -533,86 +684,65 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, is_curr
         if not is_current_dir:
             project_path.mkdir(parents=True)
         
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        with zipfile.ZipFile(archive, 'r') as zip_ref:
             # List all files in the ZIP for debugging
-            zip_contents = zip_ref.namelist()
+            infos = zip_ref.infolist()
             if tracker:
                 tracker.start("zip-list")
-                tracker.complete("zip-list", f"{len(zip_contents)} entries")
+                tracker.complete("zip-list", f"{len(infos)} entries")
             elif verbose:
-                console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
+                console.print(f"[cyan]ZIP contains {len(infos)} items[/cyan]")
             
-            # For current directory, extract to a temp location first
+            # For current directory, stream entries straight into place
             if is_current_dir:
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-                    zip_ref.extractall(temp_path)
-                    
-                    # Check what was extracted
-                    extracted_items = list(temp_path.iterdir())
-                    if tracker:
-                        tracker.start("extracted-summary")
-                        tracker.complete("extracted-summary", f"temp {len(extracted_items)} items")
-                    elif verbose:
-                        console.print(f"[cyan]Extracted {len(extracted_items)} items to temp location[/cyan]")
-                    
-                    # Handle GitHub-style ZIP with a single root directory
-                    source_dir = temp_path
-                    if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                        source_dir = extracted_items[0]
+                top_level = {info.filename.split('/', 1)[0] for info in infos}
+                if tracker:
+                    tracker.start("extracted-summary")
+                    tracker.complete("extracted-summary", f"{len(top_level)} top-level items")
+                elif verbose:
+                    console.print(f"[cyan]Archive has {len(top_level)} top-level items[/cyan]")
+                
+                # Handle GitHub-style ZIP with a single root directory
+                prefix = ""
+                if len(top_level) == 1:
+                    root = next(iter(top_level))
+                    if any(info.filename.startswith(f"{root}/") for info in infos):
+                        prefix = f"{root}/"
                         if tracker:
                             tracker.add("flatten", "Flatten nested directory")
                             tracker.complete("flatten")
                         elif verbose:
                             console.print(f"[cyan]Found nested directory structure[/cyan]")
-                    
-                    # Copy contents to current directory
-                    for item in source_dir.iterdir():
-                        dest_path = project_path / item.name
-                        if item.is_dir():
-                            if dest_path.exists():
-                                if verbose and not tracker:
-                                    console.print(f"[yellow]Merging directory:[/yellow] {item.name}")
-                                # Recursively copy directory contents
-                                for sub_item in item.rglob('*'):
-                                    if sub_item.is_file():
-                                        rel_path = sub_item.relative_to(item)
-                                        dest_file = dest_path / rel_path
-                                        dest_file.parent.mkdir(parents=True, exist_ok=True)
-                                        shutil.copy2(sub_item, dest_file)
-                            else:
-                                shutil.copytree(item, dest_path)
-                        else:
-                            if dest_path.exists() and verbose and not tracker:
-                                console.print(f"[yellow]Overwriting file:[/yellow] {item.name}")
-                            shutil.copy2(item, dest_path)
-                    if verbose and not tracker:
-                        console.print(f"[cyan]Template files merged into current directory[/cyan]")
+                
+                _merge_zip_into_dir(zip_ref, infos, project_path, prefix, verbose=verbose and not tracker)
+                if verbose and not tracker:
+                    console.print(f"[cyan]Template files merged into current directory[/cyan]")
             else:
-                # Extract directly to project directory (original behavior)
-                zip_ref.extractall(project_path)
+                # Extract directly to project directory, streaming entries in 1 MiB blocks
+                _merge_zip_into_dir(zip_ref, infos, project_path)
                 
-                # Check what was extracted
-                extracted_items = list(project_path.iterdir())
+                # Check what was extracted (DirEntry caches the file type, no extra stat)
+                with os.scandir(project_path) as it:
+                    extracted_items = list(it)
                 if tracker:
                     tracker.start("extracted-summary")
                     tracker.complete("extracted-summary", f"{len(extracted_items)} top-level items")
                 elif verbose:
                     console.print(f"[cyan]Extracted {len(extracted_items)} items to {project_path}:[/cyan]")
                     for item in extracted_items:
-                        console.print(f"  - {item.name} ({'dir' if item.is_dir() else 'file'})")
+                        console.print(f"  - {item.name} ({'dir' if item.is_dir(follow_symlinks=False) else 'file'})")
                 
                 # Handle GitHub-style ZIP with a single root directory
-                if len(extracted_items) == 1 and extracted_items[0].is_dir():
+                if len(extracted_items) == 1 and extracted_items[0].is_dir(follow_symlinks=False):
                     # Move contents up one level
                     nested_dir = extracted_items[0]
                     temp_move_dir = project_path.parent / f"{project_path.name}_temp"
-                    # Move the nested directory contents to temp location
-                    shutil.move(str(nested_dir), str(temp_move_dir))
+                    # Both paths sit next to project_path, so plain renames suffice (no data is copied)
+                    os.rename(nested_dir.path, temp_move_dir)
                     # Remove the now-empty project directory
                     project_path.rmdir()
                     # Rename temp directory to project directory
-                    shutil.move(str(temp_move_dir), str(project_path))
+                    os.rename(temp_move_dir, project_path)
                     if tracker:
                         tracker.add("flatten", "Flatten nested directory")
                         tracker.complete("flatten")
@@ -635,13 +765,12 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, is_curr
     finally:
         if tracker:
             tracker.add("cleanup", "Remove temporary archive")
-        # Clean up downloaded ZIP file
-        if zip_path.exists():
-            zip_path.unlink()
-            if tracker:
-                tracker.complete("cleanup")
-            elif verbose:
-                console.print(f"Cleaned up: {zip_path.name}")
+        # Release the downloaded archive buffer
+        archive.close()
+        if tracker:
+            tracker.complete("cleanup")
+        elif verbose:
+            console.print(f"Cleaned up: {meta['filename']}")
     
     return project_path
 
@@ -691,11 +820,8 @@ def initialize_brownfield_project(project_path: Path, project_name: str, no_git:
     show_brownfield_next_steps(project_path, project_name)
 
 
-def create_brownfield_files(project_path: Path, project_name: str):
-    """Create brownfield-specific configuration files."""
-
-    # Create .augment/guidelines.md
-    guidelines_content = f"""# {project_name} - AUGGIE Guidelines
+# Brownfield integration files; {project_name} is filled in by create_brownfield_files
+_GUIDELINES_TMPL = """# {project_name} - AUGGIE Guidelines
 
 ## Project Context
 This is a brownfield integration of Spec-Kit into an existing project.
@@ -722,10 +848,7 @@ This is a brownfield integration of Spec-Kit into an existing project.
 *Generated by Spec-Kit Brownfield Integration*
 """
 
-    (project_path / ".augment" / "guidelines.md").write_text(guidelines_content)
-
-    # Create memory/constitution.md
-    constitution_content = f"""# {project_name} - Project Constitution
+_CONSTITUTION_TMPL = """# {project_name} - Project Constitution
 
 ## Core Principles
 
@@ -760,10 +883,7 @@ This is a brownfield integration of Spec-Kit into an existing project.
 *This constitution guides all specification and implementation decisions*
 """
 
-    (project_path / "memory" / "constitution.md").write_text(constitution_content)
-
-    # Create .augment/context/README.md
-    context_readme = """# Project Context Materials
+_CONTEXT_README = """# Project Context Materials
 
 This directory contains comprehensive planning documents that provide context for AUGGIE when generating specifications.
 
@@ -791,7 +911,28 @@ AUGGIE will automatically read and analyze all documents in this directory when
 Add your project-specific documents here to ensure AUGGIE understands your existing project's needs and constraints.
 """
 
-    (project_path / ".augment" / "context" / "README.md").write_text(context_readme)
+
+def _bulk_write(root: Path, files: dict[str, str]) -> None:
+    """Write {relative path: text} under root as UTF-8, creating each parent directory once."""
+    by_dir: dict[Path, list[tuple[Path, str]]] = {}
+    for rel, content in files.items():
+        target = root / rel
+        by_dir.setdefault(target.parent, []).append((target, content))
+    for directory, items in by_dir.items():
+        directory.mkdir(parents=True, exist_ok=True)
+        for target, content in items:
+            with open(target, "wb") as f:
+                f.write(content.encode("utf-8"))
+
+
+def create_brownfield_files(project_path: Path, project_name: str):
+    """Create brownfield-specific configuration files."""
+    fields = {"project_name": project_name}
+    _bulk_write(project_path, {
+        ".augment/guidelines.md": _GUIDELINES_TMPL.format_map(fields),
+        "memory/constitution.md": _CONSTITUTION_TMPL.format_map(fields),
+        ".augment/context/README.md": _CONTEXT_README,
+    })
 
     console.print("[green]✓[/green] Created configuration files")
 
@@ -799,25 +940,26 @@ Add your project-specific documents here to ensure AUGGIE understands your exist
 def show_brownfield_next_steps(project_path: Path, project_name: str):
     """Show next steps for brownfield integration."""
 
-    steps_lines = []
-    steps_lines.append("1. Add project context materials to .augment/context/")
-    steps_lines.append("   - Document your existing architecture and constraints")
-    steps_lines.append("   - Add business requirements and user personas")
-    steps_lines.append("   - Include technical documentation and API specs")
-    steps_lines.append("")
-    steps_lines.append("2. Generate your first feature specification:")
-    steps_lines.append("   specify scope-spec \"Your new feature description\" --complexity=simple")
-    steps_lines.append("")
-    steps_lines.append("3. Create implementation plan:")
-    steps_lines.append("   specify plan \"Technical approach that fits your existing stack\"")
-    steps_lines.append("")
-    steps_lines.append("4. Generate development tasks:")
-    steps_lines.append("   specify tasks \"Additional context for task generation\"")
-    steps_lines.append("")
-    steps_lines.append("5. Review and refine:")
-    steps_lines.append("   - Check specs/ directory for generated specifications")
-    steps_lines.append("   - Resolve any [NEEDS CLARIFICATION] items")
-    steps_lines.append("   - Update memory/constitution.md with project-specific constraints")
+    steps_lines = (
+        "1. Add project context materials to .augment/context/",
+        "   - Document your existing architecture and constraints",
+        "   - Add business requirements and user personas",
+        "   - Include technical documentation and API specs",
+        "",
+        "2. Generate your first feature specification:",
+        "   specify scope-spec \"Your new feature description\" --complexity=simple",
+        "",
+        "3. Create implementation plan:",
+        "   specify plan \"Technical approach that fits your existing stack\"",
+        "",
+        "4. Generate development tasks:",
+        "   specify tasks \"Additional context for task generation\"",
+        "",
+        "5. Review and refine:",
+        "   - Check specs/ directory for generated specifications",
+        "   - Resolve any [NEEDS CLARIFICATION] items",
+        "   - Update memory/constitution.md with project-specific constraints",
+    )
 
     steps_panel = Panel("\n".join(steps_lines), title="Next steps", border_style="cyan", padding=(1,2))
     console.print()
@@ -881,10 +1023,11 @@ def init(
             console.print("[red]Error:[/red] Must specify either a project name or use --here flag")
             raise typer.Exit(1)
     
-    # Determine project directory
+    # Determine project directory (one getcwd shared by every branch)
+    cwd = Path.cwd()
     if brownfield:
-        project_name = Path.cwd().name
-        project_path = Path.cwd()
+        project_name = cwd.name
+        project_path = cwd
 
         # Check if already has Spec-Kit integration
         if (project_path / ".augment").exists():
@@ -895,20 +1038,26 @@ def init(
                 raise typer.Exit(0)
 
         # Validate it's a real project directory
-        existing_items = list(project_path.iterdir())
-        if not existing_items:
+        # Reading a single entry is enough to tell the directory is not empty
+        with os.scandir(project_path) as it:
+            first_entry = next(it, None)
+        if first_entry is None:
             console.print("[red]Error:[/red] Current directory is empty - not a valid project")
             console.print("[yellow]Tip:[/yellow] Run this command in your existing project directory")
             raise typer.Exit(1)
 
     elif here:
-        project_name = Path.cwd().name
-        project_path = Path.cwd()
+        project_name = cwd.name
+        project_path = cwd
 
         # Check if current directory has any files
-        existing_items = list(project_path.iterdir())
-        if existing_items:
-            console.print(f"[yellow]Warning:[/yellow] Current directory is not empty ({len(existing_items)} items)")
+        with os.scandir(project_path) as it:
+            if next(it, None) is not None:
+                existing_count = 1 + sum(1 for _ in it)
+            else:
+                existing_count = 0
+        if existing_count:
+            console.print(f"[yellow]Warning:[/yellow] Current directory is not empty ({existing_count} items)")
             console.print("[yellow]Template files will be merged with existing content and may overwrite existing files[/yellow]")
 
             # Ask for confirmation
@@ -917,7 +1066,7 @@ def init(
                 console.print("[yellow]Operation cancelled[/yellow]")
                 raise typer.Exit(0)
     else:
-        project_path = Path(project_name).resolve()
+        project_path = cwd / project_name
         # Check if project directory already exists
         if project_path.exists():
             console.print(f"[red]Error:[/red] Directory '{project_name}' already exists")
@@ -939,7 +1088,7 @@ def init(
 
     # AI assistant selection
     if ai_assistant:
-        if ai_assistant not in AI_CHOICES:
+        if ai_assistant not in _AI_SET:
             console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'. Choose from: {', '.join(AI_CHOICES.keys())}")
             raise typer.Exit(1)
         selected_ai = ai_assistant
@@ -987,16 +1136,20 @@ def init(
     ]:
         tracker.add(key, label)
 
-    # Use transient so live tree is replaced by the final static render (avoids duplicate output)
-    with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
+    # Use transient so live tree is replaced by the final static render (avoids duplicate output).
+    # Piped/redirected output only gets that final render, so skip Live and its refresh thread there.
+    if console.is_terminal:
+        from rich.live import Live
+
+        live = Live(tracker.render(), console=console, refresh_per_second=8, transient=True)
         tracker.attach_refresh(lambda: live.update(tracker.render()))
-        try:
-            # Create a httpx client with verify based on skip_tls
-            verify = not skip_tls
-            local_ssl_context = ssl_context if verify else False
-            local_client = httpx.Client(verify=local_ssl_context)
+    else:
+        live = contextlib.nullcontext()
 
-            download_and_extract_template(project_path, selected_ai, here, verbose=False, tracker=tracker, client=local_client)
+    with live:
+        try:
+            # Shared httpx client with verify based on skip_tls
+            download_and_extract_template(project_path, selected_ai, here, verbose=False, tracker=tracker, client=_get_client(not skip_tls))
 
             # Git step
             if not no_git:
@@ -1028,25 +1181,23 @@ def init(
     console.print("\n[bold green]Project ready.[/bold green]")
     
     # Boxed "Next steps" section
-    steps_lines = []
     if not here:
-        steps_lines.append(f"1. [bold green]cd {project_name}[/bold green]")
-        step_num = 2
+        first_step = f"1. [bold green]cd {project_name}[/bold green]"
     else:
-        steps_lines.append("1. You're already in the project directory!")
-        step_num = 2
+        first_step = "1. You're already in the project directory!"
 
     # Enhanced AUGGIE-only workflow
-    steps_lines.append(f"{step_num}. Load enhanced AUGGIE commands and start developing")
-    steps_lines.append("   - Run: source templates/auggie-commands.sh")
-    steps_lines.append("   - Use auggie-specify for complete specifications")
-    steps_lines.append("   - Use auggie-design-spec for UI/UX specifications")
-    steps_lines.append("   - Use auggie-plan for pragmatic implementation plans")
-    steps_lines.append("   - Use auggie-tasks for detailed task breakdowns")
-    steps_lines.append("   - See README.md for complete enhanced workflow")
-
-    step_num += 1
-    steps_lines.append(f"{step_num}. Update [bold magenta]CONSTITUTION.md[/bold magenta] with your project's non-negotiable principles")
+    steps_lines = (
+        first_step,
+        "2. Load enhanced AUGGIE commands and start developing",
+        "   - Run: source templates/auggie-commands.sh",
+        "   - Use auggie-specify for complete specifications",
+        "   - Use auggie-design-spec for UI/UX specifications",
+        "   - Use auggie-plan for pragmatic implementation plans",
+        "   - Use auggie-tasks for detailed task breakdowns",
+        "   - See README.md for complete enhanced workflow",
+        "3. Update [bold magenta]CONSTITUTION.md[/bold magenta] with your project's non-negotiable principles",
+    )
 
     steps_panel = Panel("\n".join(steps_lines), title="Next steps", border_style="cyan", padding=(1,2))
     console.print()  # blank line
@@ -1064,11 +1215,10 @@ def check(skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS
 
     # Check if we have internet connectivity by trying to reach GitHub API
     console.print("[cyan]Checking internet connectivity...[/cyan]")
-    verify = not skip_tls
-    local_ssl_context = ssl_context if verify else False
-    local_client = httpx.Client(verify=local_ssl_context)
+    import httpx
+
     try:
-        response = local_client.get("https://api.github.com", timeout=5, follow_redirects=True)
+        response = _get_client(not skip_tls).get("https://api.github.com", timeout=5, follow_redirects=True)
         console.print("[green]✓[/green] Internet connection available")
     except httpx.RequestError:
         console.print("[red]✗[/red] No internet connection - required for downloading templates")
@@ -1092,20 +1242,27 @@ def check(skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS
 # BROWNFIELD CLI COMMANDS
 # ============================================================================
 
-def detect_project_context():
-    """Detect what type of project we're in."""
-    cwd = Path.cwd()
+@functools.lru_cache(maxsize=8)
+def _scan_project_context(cwd: Path) -> str:
+    # One readdir answers all three sentinel checks for the working directory
+    try:
+        with os.scandir(cwd) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        names = set()
 
     # Check for Spec-Kit multi-project workspace
-    if (cwd / "projects").exists() and (cwd / "templates").exists():
+    if "projects" in names and "templates" in names:
         return "greenfield_workspace"
 
     # Check for brownfield Spec-Kit integration
-    if (cwd / ".augment").exists():
+    if ".augment" in names:
         return "brownfield_project"
 
     # Check if we're inside a multi-project
-    parent = cwd
+    if "projects" in names:
+        return "inside_greenfield_project"
+    parent = cwd.parent
     while parent != parent.parent:
         if (parent / "projects").exists():
             return "inside_greenfield_project"
@@ -1115,9 +1272,18 @@ def detect_project_context():
     return "regular_project"
 
 
+def detect_project_context(cwd: Optional[Path] = None) -> str:
+    """Detect what type of project we're in (memoized per working directory)."""
+    return _scan_project_context(cwd or Path.cwd())
+
+
 def require_brownfield_context():
     """Ensure we're in a brownfield project context."""
-    context = detect_project_context()
+    # A workspace root also has .augment/, so the greenfield check must run first;
+    # detection is a single memoized scandir of the cwd
+    context = detect_project_context(Path.cwd())
+    if context == "brownfield_project":
+        return True
 
     if context == "greenfield_workspace":
         console.print("[red]Error:[/red] You're in a Spec-Kit workspace. Use auggie-* commands instead:")
@@ -1136,18 +1302,11 @@ def require_brownfield_context():
     return context == "brownfield_project"
 
 
-def execute_auggie_command(command_template: str, context: str = ""):
-    """Execute AUGGIE command with proper codebase context."""
-    cwd = Path.cwd()
-
-    # Ensure AUGGIE is available
-    if not shutil.which("auggie"):
-        console.print("[red]Error:[/red] AUGGIE CLI not found")
-        console.print("[yellow]Install with:[/yellow] npm install -g @augmentcode/auggie")
-        raise typer.Exit(1)
+# Fixed argv prefix for brownfield AUGGIE runs; the prompt is appended as the --print value
+_AUGGIE_ARGV = ("auggie", "--quiet", "--print")
 
-    # Execute AUGGIE with explicit codebase context
-    full_command = f"""
+# Wrapper around every brownfield subcommand prompt; only the three fields vary per call
+_AUGGIE_PROMPT_TMPL = """
     CRITICAL: Use codebase-retrieval to analyze the existing codebase before generating any specifications.
 
     {command_template}
@@ -1171,10 +1330,24 @@ def execute_auggie_command(command_template: str, context: str = ""):
     Start by using codebase-retrieval to understand the existing project structure and patterns.
     """
 
+
+def execute_auggie_command(command_template: str, context: str = ""):
+    """Execute AUGGIE command with proper codebase context."""
+    cwd = Path.cwd()
+
+    # Ensure AUGGIE is available
+    if not _which("auggie"):
+        console.print("[red]Error:[/red] AUGGIE CLI not found")
+        console.print("[yellow]Install with:[/yellow] npm install -g @augmentcode/auggie")
+        raise typer.Exit(1)
+
+    # Execute AUGGIE with explicit codebase context
+    full_command = _AUGGIE_PROMPT_TMPL.format(command_template=command_template, cwd=cwd, context=context)
+
     # Run AUGGIE command from project directory to ensure proper context
     try:
         result = subprocess.run(
-            ["auggie", "--quiet", "--print", full_command],
+            [*_AUGGIE_ARGV, full_command],
             cwd=cwd,
             check=True,
             capture_output=False
@@ -1845,11 +2018,30 @@ def export_specs(
         console.print("[red]❌ Failed to export specifications[/red]")
 
 
+def _count_md(root: Path, recursive: bool = True) -> int:
+    """Count .md files under root with scandir, using the cached entry type instead of a stat per entry."""
+    count = 0
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    count += 1
+    return count
+
+
 @app.command(name="status")
 def status():
     """Check Spec-Kit status in current project."""
-    context = detect_project_context()
     cwd = Path.cwd()
+    context = detect_project_context(cwd)
 
     console.print(f"[bold]Spec-Kit Status for {cwd.name}[/bold]\n")
 
@@ -1860,10 +2052,12 @@ def status():
     elif context == "brownfield_project":
         console.print("[blue]Context:[/blue] Brownfield Spec-Kit integration")
 
-        # Check directory structure
-        augment_exists = (cwd / ".augment").exists()
-        specs_exists = (cwd / "specs").exists()
-        memory_exists = (cwd / "memory").exists()
+        # Check directory structure (one readdir instead of a stat per directory)
+        with os.scandir(cwd) as it:
+            dirs = {entry.name for entry in it if entry.is_dir()}
+        augment_exists = ".augment" in dirs
+        specs_exists = "specs" in dirs
+        memory_exists = "memory" in dirs
 
         console.print(f"[green]✓[/green] .augment/ directory: {'Present' if augment_exists else 'Missing'}")
         console.print(f"[green]✓[/green] specs/ directory: {'Present' if specs_exists else 'Missing'}")
@@ -1871,15 +2065,15 @@ def status():
 
         # Check for specifications
         if specs_exists:
-            spec_files = list((cwd / "specs").glob("**/*.md"))
-            console.print(f"[blue]Specifications:[/blue] {len(spec_files)} files found")
+            spec_count = _count_md(cwd / "specs")
+            console.print(f"[blue]Specifications:[/blue] {spec_count} files found")
 
         # Check for context materials
         if augment_exists:
             context_dir = cwd / ".augment" / "context"
-            if context_dir.exists():
-                context_files = list(context_dir.glob("*.md"))
-                console.print(f"[blue]Context materials:[/blue] {len(context_files)} files")
+            if context_dir.is_dir():
+                context_count = _count_md(context_dir, recursive=False)
+                console.print(f"[blue]Context materials:[/blue] {context_count} files")
             else:
                 console.print("[yellow]⚠[/yellow] No context materials found in .augment/context/")
 